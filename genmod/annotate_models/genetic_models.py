@@ -208,7 +208,7 @@ def check_genetic_models(variant_batch, families, phased = False,
                 variant_1 = variant_batch[pair[0]]
                 variant_2 = variant_batch[pair[1]]
                 # Check that the pair is in the same feature:
-                if variant_1['annotation'].intersection(variant_2['annotation']):
+                if not variant_1['annotation'].isdisjoint(variant_2['annotation']):
                     if len(individuals) == 1:
                         variant_1['compounds'][family_id].add(pair[1])
                         variant_2['compounds'][family_id].add(pair[0])
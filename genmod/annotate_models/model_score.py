@@ -25,9 +25,7 @@ def get_model_score(individuals, variant):
     genotype_scores = []
     
     for individual in individuals:
-        logger.debug("Checking gt call for individual {0}".format(
-            individual
-        ))
+        logger.debug("Checking gt call for individual %s", individual)
         
         gt_call = variant.get('genotypes', {}).get(individual, None)
         if gt_call:
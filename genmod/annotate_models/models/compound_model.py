@@ -46,9 +46,8 @@ def check_compounds(variant_1, variant_2, family, intervals, phased):
     # individual picked.
     logger = logging.getLogger(__name__)
     
-    for individual_id in family.individuals:
-        logger.debug("Check compounds for individual {0}".format(individual_id))
-        individual = family.individuals[individual_id]
+    for individual_id, individual in family.individuals.items():
+        logger.debug("Check compounds for individual %s", individual_id)
         
         genotype_1 = variant_1['genotypes'][individual_id]
         genotype_2 = variant_2['genotypes'][individual_id]
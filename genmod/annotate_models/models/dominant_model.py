@@ -53,21 +53,18 @@ def check_dominant(variant, family, strict=False):
     
     """
     
-    for individual in family.individuals: 
+    for individual, individual_obj in family.individuals.items():
         # Check in all individuals what genotypes that are in the trio based 
         # of the individual picked.
-        logger.debug("Checking autosomal dominant pattern for variant {0},"\
-        " individual: {1}".format(
-            variant.get('variant_id', None),
-            individual)
-        )
+        logger.debug("Checking autosomal dominant pattern for variant %s,"\
+        " individual: %s", variant.get('variant_id', None), individual)
         individual_genotype = variant['genotypes'][individual]
         if strict:
             if not individual_genotype.genotyped:
                 return False
         # The case where the individual is healthy
-        if family.individuals[individual].healthy:
-            logger.debug("Individual {0} is healthy".format(individual))
+        if individual_obj.healthy:
+            logger.debug("Individual %s is healthy", individual)
             if individual_genotype.has_variant:
                 if variant.get('reduced_penetrance', False):
                     if individual_genotype.homo_alt:
@@ -75,8 +72,8 @@ def check_dominant(variant, family, strict=False):
                 else:
                     return False
         
-        elif family.individuals[individual].affected:
-            logger.debug("Individual {0} is affected".format(individual))
+        elif individual_obj.affected:
+            logger.debug("Individual %s is affected", individual)
             # The case when the individual is sick
             if individual_genotype.genotyped:
                 if not individual_genotype.heterozygote:
@@ -46,20 +46,20 @@ def check_recessive(variant, family, strict):
         bool: depending on if the model is followed in these indivduals
     
     """
-    for individual in family.individuals:
+    for individual, individual_obj in family.individuals.items():
         individual_genotype = variant['genotypes'][individual]
         if strict:
             if not individual_genotype.genotyped:
                 return False
         # The case where the individual is healthy:
-        if family.individuals[individual].healthy:
+        if individual_obj.healthy:
         # If the individual is healthy and homozygote alt the model is broken.
             if individual_genotype.genotyped:
                 if individual_genotype.homo_alt:
                     return False
                 
         # The case when the individual is sick:
-        elif family.individuals[individual].affected:
+        elif individual_obj.affected:
         # In the case of a sick individual it must be homozygote alternative 
         # for Autosomal recessive to be true.
         # Also, we can not exclude the model if no call.
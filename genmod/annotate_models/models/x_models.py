@@ -51,7 +51,7 @@ def check_X_recessive(variant, family, strict=False):
     
     """
     
-    for individual in family.individuals:
+    for individual, individual_obj in family.individuals.items():
         # Get the genotype for this variant for this individual
         individual_genotype = variant['genotypes'][individual]
         
@@ -59,25 +59,25 @@ def check_X_recessive(variant, family, strict=False):
             if not individual_genotype.genotyped:
                 return False
         # The case where the individual is healthy
-        if family.individuals[individual].healthy:
+        if individual_obj.healthy:
             # If individual is healthy and homozygote alternative 
             # the variant can not be deleterious:
             if individual_genotype.genotyped:
                 if individual_genotype.homo_alt:
                     return False
                 # If individual is male it can not have the variant at all
-                if family.individuals[individual].sex == 1:
+                if individual_obj.sex == 1:
                     if individual_genotype.has_variant:
                         return False
         
         # The case when the individual is sick
-        elif family.individuals[individual].affected:
+        elif individual_obj.affected:
         #If the individual is sick and homozygote ref it can not be x-recessive
             if individual_genotype.genotyped:
                 if individual_genotype.homo_ref:
                     return False
         # Women have to be hom alt to be sick (almost allways carriers)
-                elif family.individuals[individual].sex == 2:
+                elif individual_obj.sex == 2:
                     if not individual_genotype.homo_alt:
                         return False
     return True
@@ -117,7 +117,7 @@ def check_X_dominant(variant, family, strict=False):
         bool: depending on if the model is followed in these indivduals
     
     """
-    for individual in family.individuals:
+    for individual, individual_obj in family.individuals.items():
         # Get the genotype for this variant for this individual
         individual_genotype = variant['genotypes'][individual]
         
@@ -125,19 +125,19 @@ def check_X_dominant(variant, family, strict=False):
             if not individual_genotype.genotyped:
                 return False
         # The case where the individual is healthy
-        if family.individuals[individual].healthy:
+        if individual_obj.healthy:
         # Healthy womans can be carriers but not homozygote:
             if individual_genotype.genotyped:
-                if family.individuals[individual].sex == 2:
+                if individual_obj.sex == 2:
                     if individual_genotype.homo_alt:
                         return False
                 # Males can not carry the variant:
-                elif family.individuals[individual].sex == 1:
+                elif individual_obj.sex == 1:
                     if individual_genotype.has_variant:
                         return False
         
         # The case when the individual is sick
-        elif family.individuals[individual].affected:
+        elif individual_obj.affected:
         # If the individual is sick and homozygote ref it 
         # can not be x-linked-dominant
             if individual_genotype.genotyped:
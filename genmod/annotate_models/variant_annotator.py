@@ -20,6 +20,12 @@ from multiprocessing import Process
 from genmod.vcf_tools import get_genotypes
 from . import (get_haploblocks, check_genetic_models, get_model_score, 
                make_print_version)
+
+# Keys that are only used while annotating, these are removed before the 
+# variants are sent to the printer
+ANNOTATION_ONLY_KEYS = ('genotypes', 'compounds', 'inheritance_models', 
+                        'annotation', 'vep_info', 'compound_candidate', 
+                        'reduced_penetrance')
                 
 
 class VariantAnnotator(Process):
@@ -138,13 +144,21 @@ class VariantAnnotator(Process):
                 )
 
             # # Now we want to make versions of the variants that are ready for printing.
+            # The whole batch is sent to the printer in one go to avoid a 
+            # queue round trip per variant
+            print_variants = []
             for variant_id in variant_batch:
                 variant = make_print_version(
                     variant=variant_batch[variant_id],
                     families=self.families
                 )
-                self.logger.debug("Putting variant in results_queue")
-                self.results_queue.put(variant)
+                # The annotations are now merged into the INFO field so 
+                # there is no need to send them to the printer
+                for key in ANNOTATION_ONLY_KEYS:
+                    variant.pop(key, None)
+                print_variants.append(variant)
+            self.logger.debug("Putting variant batch in results_queue")
+            self.results_queue.put(print_variants)
                 
             self.task_queue.task_done()
         
@@ -28,7 +28,12 @@ def get_region(chrom, start, end, region_trees):
     regions = set()
     if chrom in region_trees:
         tree = region_trees[chrom]
-        result = tree[start:end]
+        if end - start == 1:
+            # A single position, a point query is much cheaper than a 
+            # range query and gives the same result
+            result = tree.at(start)
+        else:
+            result = tree[start:end]
         for interval in result:
             regions.add(interval.data)
     return regions
@@ -53,17 +53,24 @@ def build_region_trees(bed_lines, padding):
             padding (int): Defines what should be considered upstream 
                            and downstream variants
     """
-    region_trees = {}
+    # Collect the intervals first and build each tree in one go, this is
+    # much faster than adding the intervals one by one since the tree
+    # does not need to be rebalanced for every insert
+    chrom_intervals = {}
     for region in bed_parser(bed_lines, padding):
         chrom = region['chrom']
         start = region['start']
         stop = region['stop']
         symbol = region['symbol']
 
-        if chrom not in region_trees:
-            region_trees[chrom] = IntervalTree()
+        if chrom not in chrom_intervals:
+            chrom_intervals[chrom] = []
+
+        chrom_intervals[chrom].append(Interval(start, stop, symbol))
 
-        region_trees[chrom].add(Interval(start, stop, symbol))
+    region_trees = {}
+    for chrom in chrom_intervals:
+        region_trees[chrom] = IntervalTree(chrom_intervals[chrom])
 
     return region_trees
 
@@ -28,6 +28,10 @@ def annotate_variant(variant, annotation_arguments):
     end = pos + 1
     # end = pos + max(len(ref), len(alt))
     
+    # The name each chromosome has in the tabix files, one map per file. These
+    # live with the readers so they are dropped together with them
+    contig_names = annotation_arguments.setdefault('contig_names', {})
+    
     #Check which annotations that are available
     regions = None
     if 'region_trees' in annotation_arguments:
@@ -37,7 +41,8 @@ def annotate_variant(variant, annotation_arguments):
     
     if 'exac' in annotation_arguments:
         reader = annotation_arguments['exac']
-        frequencies = get_frequencies(reader, chrom, start, alt)
+        frequencies = get_frequencies(reader, chrom, start, alt,
+                                      contig_names.setdefault('exac', {}))
         if 'AF' in frequencies:
             info.append("EXACAF={0}".format(frequencies['AF']))
         if annotation_arguments.get('max_af'):
@@ -46,7 +51,8 @@ def annotate_variant(variant, annotation_arguments):
 
     if 'thousand_g' in annotation_arguments:
         reader = annotation_arguments['thousand_g']
-        frequencies = get_frequencies(reader, chrom, start, alt)
+        frequencies = get_frequencies(reader, chrom, start, alt,
+                                      contig_names.setdefault('thousand_g', {}))
         if 'AF' in frequencies:
             info.append("1000GAF={0}".format(frequencies['AF']))
         if annotation_arguments.get('max_af'):
@@ -55,16 +61,18 @@ def annotate_variant(variant, annotation_arguments):
 
     if 'spidex' in annotation_arguments:
         reader = annotation_arguments['spidex']
-        spidex_score = get_spidex_score(reader, chrom, start, alt)
+        spidex_score = get_spidex_score(reader, chrom, start, alt,
+                                        contig_names.setdefault('spidex', {}))
         if spidex_score:
             info.append("SPIDEX={0}".format(spidex_score))
 
     if 'cadd_files' in annotation_arguments:
         readers = annotation_arguments['cadd_files']
         cadd_scores = {}
-        for reader in readers:
+        for i, reader in enumerate(readers):
             if not cadd_scores:
-                cadd_scores = get_cadd_scores(reader, chrom, start, alt)
+                cadd_scores = get_cadd_scores(reader, chrom, start, alt,
+                                contig_names.setdefault(('cadd_files', i), {}))
 
         if cadd_scores:
             info.append("CADD={0}".format(cadd_scores['cadd_phred']))
@@ -15,11 +15,15 @@ def get_tabixhandle(path):
         raise TabixError("File {0} does not end with '.gz'".format(path))
     index_file = path + '.tbi'
     if not os.path.isfile(index_file):
+        # pytabix can only read the classic tbi indexes
+        if os.path.isfile(path + '.csi'):
+            raise TabixError("Only a csi index could be found for {0}, please"\
+                             " index the file with 'tabix' without --csi".format(path))
         raise TabixError("No index could be found for {0}".format(path))
     
     return tabix.open(path)
 
-def get_tabix_records(tabix_reader, chrom, start):
+def get_tabix_records(tabix_reader, chrom, start, contig_names=None):
     """Get the tabix records for some given coordinates
     
     Args:
@@ -27,30 +31,44 @@ def get_tabix_records(tabix_reader, chrom, start):
         chrom (str): The chromosome of the position
         start (str): The start position of the variant
         alt (str): The alternative sequence
+        contig_names (dict): Map from chromosome to the name it has in the
+                             file, None if it does not exist in the file.
+                             Filled in as the file is queried.
     
     Returns:
         records (Iterable): The overlapping records found
     """
     records = []
-    logger.debug("Looking for record in %s" % (tabix_reader))
-    logger.debug("Looking for records with chr:%s, pos:%s" % (chrom, start))
+    logger.debug("Looking for record in %s", tabix_reader)
+    logger.debug("Looking for records with chr:%s, pos:%s", chrom, start)
     tabix_key = int(start)
+    contig = chrom
+    if contig_names is not None:
+        contig = contig_names.get(chrom, chrom)
+    if contig is None:
+        return records
     try:
-        records = tabix_reader.query(chrom, tabix_key-1, tabix_key)
+        records = tabix_reader.query(contig, tabix_key-1, tabix_key)
     except TypeError:
-        records = tabix_reader.query(str(chrom), tabix_key-1, tabix_key)
+        records = tabix_reader.query(str(contig), tabix_key-1, tabix_key)
     except TabixError:
+        # Remember how the chromosome is named in this file so we do not 
+        # have to fail a query for every variant on the chromosome
+        contig = 'chr'+chrom
         try:
-            records = tabix_reader.query('chr'+chrom, tabix_key-1, tabix_key)
+            records = tabix_reader.query(contig, tabix_key-1, tabix_key)
         except TabixError: 
             logger.info("Chromosome {0} does not seem to exist in {1}".format(
                         chrom, tabix_reader))
+            contig = None
+        if contig_names is not None:
+            contig_names[chrom] = contig
     except:
         pass
 
     return records
 
-def get_frequencies(tabix_reader, chrom, start, alt):
+def get_frequencies(tabix_reader, chrom, start, alt, contig_names=None):
     """
     Return the frequencies from a tabix indexed vcf file.
     
@@ -59,12 +77,13 @@ def get_frequencies(tabix_reader, chrom, start, alt):
         chrom (str): The chromosome of the position
         start (str): The start position of the variant
         alt (str): The alternative sequence
+        contig_names (dict): See get_tabix_records
     
     Returns:
         frequencies (dict): A dictionary with relevant frequencies
     """
     freq = None
-    records = get_tabix_records(tabix_reader, chrom, start)
+    records = get_tabix_records(tabix_reader, chrom, start, contig_names)
 
     frequencies = {}
     for record in records:
@@ -81,7 +100,7 @@ def get_frequencies(tabix_reader, chrom, start, alt):
 
     return frequencies
 
-def get_spidex_score(tabix_reader, chrom, start, alt):
+def get_spidex_score(tabix_reader, chrom, start, alt, contig_names=None):
     """
     Return the record from a spidex file.
     
@@ -90,12 +109,13 @@ def get_spidex_score(tabix_reader, chrom, start, alt):
         chrom (str): The chromosome of the position
         start (str): The start position of the variant
         alt (str): The alternative sequence
+        contig_names (dict): See get_tabix_records
     
     Returns:
         spidex_score float: The spidex z scores for this position
     
     """
-    records = get_tabix_records(tabix_reader, chrom, start)
+    records = get_tabix_records(tabix_reader, chrom, start, contig_names)
     spidex_score = None
     
     for record in records:
@@ -107,7 +127,7 @@ def get_spidex_score(tabix_reader, chrom, start, alt):
 
     return spidex_score
 
-def get_cosmic(tabix_reader, chrom, start, alt):
+def get_cosmic(tabix_reader, chrom, start, alt, contig_names=None):
     """
     Return if record exists in cosmic database.
     
@@ -116,12 +136,13 @@ def get_cosmic(tabix_reader, chrom, start, alt):
         chrom (str): The chromosome of the position
         start (str): The start position of the variant
         alt (str): The alternative sequence
+        contig_names (dict): See get_tabix_records
     
     Returns:
         in_cosmic (bool): If variant is in COSMIC
     
     """
-    records = get_tabix_records(tabix_reader, chrom, start)
+    records = get_tabix_records(tabix_reader, chrom, start, contig_names)
     in_cosmic = False
     
     for record in records:
@@ -135,7 +156,7 @@ def get_cosmic(tabix_reader, chrom, start, alt):
 
     return in_cosmic
 
-def get_cadd_scores(tabix_reader, chrom, start, alt):
+def get_cadd_scores(tabix_reader, chrom, start, alt, contig_names=None):
     """
     Return the record from a cadd file.
     
@@ -144,13 +165,14 @@ def get_cadd_scores(tabix_reader, chrom, start, alt):
         chrom (str): The chromosome of the position
         start (str): The start position of the variant
         alternatives (str): The alternative sequence
+        contig_names (dict): See get_tabix_records
     
     Returns:
         cadd_scores (dict): The cadd scores for this position
     
     """
     cadd_scores = {}
-    records = get_tabix_records(tabix_reader, chrom, start)    
+    records = get_tabix_records(tabix_reader, chrom, start, contig_names)    
     # CADD values are only for snps:
     for record in records:
         if record[3] == alt:
@@ -21,8 +21,8 @@ import logging
 import shutil
 import itertools
 
-from multiprocessing import JoinableQueue, Manager, cpu_count, util
-from codecs import open
+from multiprocessing import JoinableQueue, Queue, cpu_count
+from io import open
 from datetime import datetime
 from tempfile import NamedTemporaryFile
 
@@ -39,7 +39,6 @@ from .utils import (temp_dir, silent, outfile, processes, variant_file,
                     family_file, family_type, get_file_handle)
 
 logger = logging.getLogger(__name__)
-util.abstract_sockets_supported = False
 
 @click.command('models', short_help="Annotate inheritance")
 @variant_file
@@ -148,11 +147,14 @@ def models(context, variant_file, family_file, family_type, reduced_penetrance,
     if not families:
         logger.warning("Please provide at least one family with affected individuals")
         context.abort()
+    # The individuals are collected once and reused for the checks below
+    # and for the workers
+    analysis_individuals = list(family_parser.individuals)
     # The individuals in the ped file must be present in the variant file:
     logger.info("Families used in analysis: {0}".format(
-                    ','.join(list(families.keys()))))
+                    ','.join(families)))
     logger.info("Individuals included in analysis: {0}".format(
-                    ','.join(list(family_parser.individuals.keys()))))
+                    ','.join(analysis_individuals)))
     
     
     head = HeaderParser()
@@ -243,19 +245,17 @@ def models(context, variant_file, family_file, family_type, reduced_penetrance,
     logger.debug("Individuals found in vcf file: {}".format(', '.join(vcf_individuals)))
     
     try:
-        check_individuals(family_parser.individuals, vcf_individuals)
+        check_individuals(analysis_individuals, vcf_individuals)
     except IOError as e:
         logger.error(e)
         logger.info("Individuals in PED file: {0}".format(
-                        ', '.join(family_parser.individuals)))
+                        ', '.join(analysis_individuals)))
         logger.info("Individuals in VCF file: {0}".format(', '.join(vcf_individuals)))
         
         context.abort()
 
     start_time_analysis = datetime.now()
 
-    analysis_individuals = list(family_parser.individuals.keys())
-    
     logger.info("Individuals used in analysis: {0}".format(
         ', '.join(analysis_individuals)))
     
@@ -271,7 +271,11 @@ def models(context, variant_file, family_file, family_type, reduced_penetrance,
     # data...
     variant_queue = JoinableQueue(maxsize=100)
     logger.debug("Setting up a Queue for storing results from workers")
-    results = Manager().Queue()
+    # Only the workers and the printer use the results queue so a plain
+    # multiprocessing Queue is enough, no need for a Manager process.
+    # The queue is bounded so that the workers can not run too far ahead 
+    # of the printer. The workers put whole batches of variants here.
+    results = Queue(maxsize=100)
 
     num_model_checkers = processes
     #Adapt the number of processes to the machine that run the analysis
@@ -300,7 +304,7 @@ def models(context, variant_file, family_file, family_type, reduced_penetrance,
             logger.debug('Starting worker {0}'.format(worker))
             worker.start()
         
-        # This process prints the variants to temporary files
+        # This thread prints the variants to temporary files
         logger.info('Seting up the variant printer')
         if len(model_checkers) == 1:
             print_headers(head=head, outfile=outfile, silent=silent)
@@ -326,7 +330,7 @@ def models(context, variant_file, family_file, family_type, reduced_penetrance,
                     outfile = temp_file.name
             )
         
-        logger.info('Starting the variant printer process')
+        logger.info('Starting the variant printer thread')
         variant_printer.start()
         
         start_time_variant_parsing = datetime.now()
@@ -346,8 +350,14 @@ def models(context, variant_file, family_file, family_type, reduced_penetrance,
             variant_queue.put(None)
         
         variant_queue.join()
+        # The workers have to exit before the printer gets its stop sign,
+        # otherwise variants still in a workers queue buffer could be lost
+        for worker in model_checkers:
+            worker.join()
         results.put(None)
         variant_printer.join()
+        if variant_printer.exception:
+            raise variant_printer.exception
         
         if len(model_checkers) > 1:
             sort_variants(infile=temp_file.name, mode='chromosome')
@@ -367,7 +377,6 @@ def models(context, variant_file, family_file, family_type, reduced_penetrance,
         logger.warning(err)
         for worker in model_checkers:
             worker.terminate()
-        variant_printer.terminate()
         context.abort()
     finally:
         if len(model_checkers) > 1:
@@ -16,7 +16,7 @@ import os
 import click
 import logging
 
-from codecs import open
+from io import open
 from tempfile import NamedTemporaryFile
 from datetime import datetime
 
@@ -60,7 +60,7 @@ def sort(variant_file, outfile, family_id, silent, position, temp_dir):
     else:
         temp_file = NamedTemporaryFile(delete=False)
     temp_file.close()
-    # Open the temp file with codecs
+    # Open the temp file as utf-8 text
     temp_file_handle = open(
                                 temp_file.name,
                                 mode='w',
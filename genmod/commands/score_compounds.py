@@ -17,8 +17,8 @@ import click
 import logging
 import itertools
 
-from multiprocessing import JoinableQueue, Manager, cpu_count, util
-from codecs import open
+from multiprocessing import JoinableQueue, Queue, cpu_count
+from io import open
 from datetime import datetime
 from tempfile import NamedTemporaryFile
 
@@ -33,7 +33,6 @@ from .utils import (variant_file, silent, outfile, processes, temp_dir,
                     get_file_handle)
 
 logger = logging.getLogger(__name__)
-util.abstract_sockets_supported = False
 
 @click.command('compound', short_help="Score compounds")
 @variant_file
@@ -96,7 +95,8 @@ def compound(context, variant_file, silent, outfile, vep, processes, temp_dir):
     logger.debug("Setting up a JoinableQueue for storing variant batches")
     variant_queue = JoinableQueue(maxsize=1000)
     logger.debug("Setting up a Queue for storing results from workers")
-    results = Manager().Queue()
+    # The scorers put whole batches of variants in the results queue
+    results = Queue(maxsize=1000)
 
     num_scorers = processes
     #Adapt the number of processes to the machine that run the analysis
@@ -120,7 +120,7 @@ def compound(context, variant_file, silent, outfile, vep, processes, temp_dir):
             logger.debug('Starting worker {0}'.format(worker))
             worker.start()
         
-        # This process prints the variants to temporary files
+        # This thread prints the variants to temporary files
         logger.info('Seting up the variant printer')
         
         # We use a temp file to store the processed variants
@@ -138,7 +138,7 @@ def compound(context, variant_file, silent, outfile, vep, processes, temp_dir):
             outfile = temp_file.name
         )
         
-        logger.info('Starting the variant printer process')
+        logger.info('Starting the variant printer thread')
         variant_printer.start()
         
         start_time_variant_parsing = datetime.now()
@@ -157,8 +157,14 @@ def compound(context, variant_file, silent, outfile, vep, processes, temp_dir):
             variant_queue.put(None)
         
         variant_queue.join()
+        # The workers have to exit before the printer gets its stop sign,
+        # otherwise variants still in a workers queue buffer could be lost
+        for worker in compound_scorers:
+            worker.join()
         results.put(None)
         variant_printer.join()
+        if variant_printer.exception:
+            raise variant_printer.exception
         
         sort_variants(infile=temp_file.name, mode='chromosome')
         
@@ -176,7 +182,6 @@ def compound(context, variant_file, silent, outfile, vep, processes, temp_dir):
         logger.warning(e)
         for worker in compound_scorers:
             worker.terminate()
-        variant_printer.terminate()
         context.abort()
     finally:
         logger.info("Removing temp file")
@@ -191,6 +191,8 @@ class CompoundScorer(Process):
                 self._get_rankscore_normalization_bounds(variant_batch)
             
             #We now have a dictionary with variant ids and rank scores, per rank_score_type
+            # The scored variants are sent to the printer as one batch
+            scored_variants = []
             for variant_id in variant_batch:
                 # If the variants only follow AR_comp (and AD for single individual families)
                 # we want to pennalise the score if the compounds have low scores
@@ -299,9 +301,10 @@ class CompoundScorer(Process):
                             annotation=new_compound_string,
                             variant_dict=variant
                         )
-                logger.debug("Putting variant in results_queue")
+                scored_variants.append(variant)
 
-                self.results_queue.put(variant)
+            logger.debug("Putting variant batch in results_queue")
+            self.results_queue.put(scored_variants)
             
             self.task_queue.task_done()
         
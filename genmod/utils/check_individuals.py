@@ -11,8 +11,8 @@ def check_individuals(ped_individuals, vcf_individuals):
         bool: if the individuals exists
     """
     
-    for individual in ped_individuals:
-        if individual not in vcf_individuals:
-            raise IOError("Individuals in PED file must exist in VCF file") # Raise proper exception here
+    # Compare as sets instead of scanning the vcf individuals per ped individual
+    if not set(ped_individuals).issubset(set(vcf_individuals)):
+        raise IOError("Individuals in PED file must exist in VCF file") # Raise proper exception here
     
     return True
\ No newline at end of file
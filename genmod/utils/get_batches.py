@@ -2,6 +2,7 @@ from __future__ import (print_function)
 
 import logging
 
+from sys import intern
 from datetime import datetime
 from collections import OrderedDict
 
@@ -75,23 +76,26 @@ def get_batches(variants, batch_queue, header, vep=False, results_queue=None,
                     allele=variant['ALT'].split(',')[0]
                     )
             
-            logger.debug("Checking variant {0}".format(variant_id))
+            logger.debug("Checking variant %s", variant_id)
 
             nr_of_variants += 1
-            new_chrom = variant['CHROM']
+            # Chromosome names are interned so that the comparisons below are
+            # mostly identity checks and so that all variants in a batch share
+            # one string object, which pickle only writes once per batch
+            new_chrom = variant['CHROM'] = intern(variant['CHROM'])
             if new_chrom.startswith('chr'):
-                new_chrom = new_chrom[3:]
+                new_chrom = intern(new_chrom[3:])
 
-            logger.debug("Update new chrom to {0}".format(new_chrom))
+            logger.debug("Update new chrom to %s", new_chrom)
 
             new_features = get_annotation(
                 variant = variant, 
                 vep = vep,
                 annotation_key = annotation_keyword
             )
-            logger.debug("Adding {0} to variant {1}".format(
-                ', '.join(new_features), variant_id
-            ))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Adding %s to variant %s", 
+                             ', '.join(new_features), variant_id)
 
             variant['annotation'] = new_features
 
@@ -105,14 +109,14 @@ def get_batches(variants, batch_queue, header, vep=False, results_queue=None,
                 logger.debug("First variant.")
                 current_features = new_features
 
-                logger.debug("Adding %s to variant batch" % variant_id)
+                logger.debug("Adding %s to variant batch", variant_id)
                 batch[variant_id] = variant
 
-                logger.debug("Updating current chrom to {0}".format(new_chrom))
+                logger.debug("Updating current chrom to %s", new_chrom)
                 current_chrom = new_chrom
 
                 chromosomes.append(current_chrom)
-                logger.debug("Adding chr {0} to chromosomes".format(new_chrom)) 
+                logger.debug("Adding chr %s to chromosomes", new_chrom) 
 
                 beginning = False
                 logger.debug("Updating beginning to False")
@@ -132,7 +136,7 @@ def get_batches(variants, batch_queue, header, vep=False, results_queue=None,
                 if new_chrom != current_chrom:
                     if current_chrom not in chromosomes:
                         chromosomes.append(current_chrom)
-                    logger.debug("Adding chr {0} to chromosomes".format(new_chrom)) 
+                    logger.debug("Adding chr %s to chromosomes", new_chrom) 
                     # New chromosome means new batch
                     send = True
                     logger.info("Chromosome {0} parsed. Time to parse"\
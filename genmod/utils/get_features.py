@@ -4,6 +4,8 @@ import logging
 
 from genmod.utils import INTERESTING_SO_TERMS, EXONIC_SO_TERMS
 
+logger = logging.getLogger(__name__)
+
 def check_vep_annotation(variant):
     """
     Return a set with the genes that vep has annotated this variant with.
@@ -45,12 +47,11 @@ def get_annotation(variant, annotation_key="Annotation", vep=False):
     Returns: 
         annotations (set): A set with annotated features
     """
-    logger = logging.getLogger(__name__)
     ##TODO use extract_vcf to get the annotation here
     
     annotation = set()
     variant_id = variant.get('variant_id', '')
-    logger.debug("Checking variant annotation for {0}".format(variant_id))
+    logger.debug("Checking variant annotation for %s", variant_id)
     # If the variant has already been annotated by genmod we do not need to 
     # check again
     if vep:
@@ -62,7 +63,7 @@ def get_annotation(variant, annotation_key="Annotation", vep=False):
         if info_dict.get(annotation_key, None):
             annotation = set(info_dict[annotation_key].split(','))
     
-    logger.debug("Annotations found for {0}: {1}".format(
-        variant_id, ','.join(annotation)
-    ))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Annotations found for %s: %s", 
+                     variant_id, ','.join(annotation))
     return annotation
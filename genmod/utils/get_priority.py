@@ -1,6 +1,10 @@
 import logging
 from genmod.score_variants import RANK_SCORE_TYPE_NAMES
 
+# The default priorities are looked up once for every variant that is 
+# printed so we remember them for each chromosome name
+CHROMOSOME_PRIORITIES = {}
+
 def get_chromosome_priority(chrom, chrom_dict={}):
     """
     Return the chromosome priority
@@ -12,26 +16,29 @@ def get_chromosome_priority(chrom, chrom_dict={}):
     Return:
         priority (str): The priority for this chromosom
     """
-    priority = '0'
+    if chrom_dict:
+        return chrom_dict.get(chrom.lstrip('chr'), '0')
     
-    chrom = chrom.lstrip('chr')
+    priority = CHROMOSOME_PRIORITIES.get(chrom)
+    if priority is not None:
+        return priority
     
-    if chrom_dict:
-        priority = chrom_dict.get(chrom, '0')
+    stripped_chrom = chrom.lstrip('chr')
+    try:
+        priority = '0'
+        if int(stripped_chrom) < 23:
+            priority = stripped_chrom
+    except ValueError:
+        if stripped_chrom == 'X':
+            priority = '23'
+        elif stripped_chrom == 'Y':
+            priority = '24'
+        elif stripped_chrom == 'MT':
+            priority = '25'
+        else:
+            priority = '26'
     
-    else:
-        try:
-            if int(chrom) < 23:
-                priority = chrom
-        except ValueError:
-            if chrom == 'X':
-                priority = '23'
-            elif chrom == 'Y':
-                priority = '24'
-            elif chrom == 'MT':
-                priority = '25'
-            else:
-                priority = '26'
+    CHROMOSOME_PRIORITIES[chrom] = priority
     
     return priority
 
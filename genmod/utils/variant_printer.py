@@ -11,18 +11,22 @@ Copyright (c) 2013 __MyCompanyName__. All rights reserved.
 
 from __future__ import (print_function)
 
-from multiprocessing import Process
-from codecs import open
+from threading import Thread
+from io import open
 
 from genmod.utils import get_chromosome_priority, get_rank_score
 from genmod.vcf_tools import print_variant
 
 import logging
 
-class VariantPrinter(Process):
+class VariantPrinter(Thread):
     """
     Print variants to a temporary file.
     
+    The printer runs as a thread in the parent process and consumes the 
+    results queue that the worker processes fill. Printing is mostly file 
+    I/O so there is no need to spawn a separate process for it.
+    
     There are three modes for printing a variant 
     'chromosome' and 'score' are used the file is going to be sorted.
     'normal' means that the variants are just printed.
@@ -34,7 +38,7 @@ class VariantPrinter(Process):
             position of the results file
     
     Args:
-        task_queue : A variants queue with batches of variants
+        task_queue : A queue with batches (lists) of variants
         head : The header line to specify what from the variant object to print
         mode : 'chromosome' or 'score'. See above.
         chr_map : If mode='chromosome' we need a map to specify the sort order
@@ -43,13 +47,18 @@ class VariantPrinter(Process):
     
     """
     def __init__(self, task_queue, head, mode='chromosome', outfile = None, silent=False):
-        Process.__init__(self)
+        Thread.__init__(self)
+        # Do not keep the interpreter alive if the analysis is aborted
+        self.daemon = True
         self.logger = logging.getLogger(__name__)
         self.task_queue = task_queue
         self.outfile = outfile
         self.header = head.header
         self.mode = mode
         self.silent = silent
+        # An error raised while printing, the parent should check this after
+        # the printer has been joined
+        self.exception = None
     
     def run(self):
         """Starts the printing"""
@@ -58,26 +67,51 @@ class VariantPrinter(Process):
         proc_name = self.name
         self.logger.info(('{0}: starting'.format(proc_name)))
         
+        # Only close handles that the printer opened itself, a handle that 
+        # was passed in is owned by the caller since we share its process
+        close_outfile = False
         if self.outfile:
             if isinstance(self.outfile, str):
                 self.outfile = open(self.outfile, 'w+', encoding="utf-8")
+                close_outfile = True
         
         while True:
             
-            # A task is a variant dictionary
-            self.logger.debug(('{0} fetching next variant'.format(proc_name)))
-            variant = self.task_queue.get()
-            
+            # A task is a list with the variant dictionaries of one batch,
+            # a single variant dictionary is also accepted
+            self.logger.debug(('{0} fetching next batch'.format(proc_name)))
+            variants = self.task_queue.get()
+
             if self.task_queue.full():
                 self.logger.warning('Variant queue full')
-            
-            if variant is None:
+
+            if variants is None:
                 self.logger.info('All variants printed.')
-                if self.outfile:
+                if close_outfile:
                     self.outfile.close()
                 break
             
-            self.logger.debug("Printing variant {0}".format(variant.get('variant_id', 'unknown')))
+            if isinstance(variants, dict):
+                variants = [variants]
+            
+            # After a failure the queue is still emptied so that the workers
+            # never block on a full results queue
+            if self.exception:
+                continue
+            
+            try:
+                self.print_variants(variants)
+            except Exception as err:
+                self.logger.error("Printing variants failed: {0}".format(err))
+                self.exception = err
+        
+        return
+    
+    def print_variants(self, variants):
+        """Print a batch of variants"""
+        for variant in variants:
+            self.logger.debug("Printing variant %s", 
+                              variant.get('variant_id', 'unknown'))
             
             priority = None
             
@@ -91,6 +125,4 @@ class VariantPrinter(Process):
             print_variant(variant_dict=variant, header_line=self.header, 
                           priority=priority, outfile=self.outfile, 
                           silent=self.silent)
-        
-        return
 
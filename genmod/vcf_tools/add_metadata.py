@@ -38,9 +38,7 @@ def add_metadata(head, metadata_type, annotation_id, annotation_number='.',
     logger = logging.getLogger(__name__)
     
     if metadata_type == 'info':
-        logger.debug("Updating INFO header with {0}".format(
-            annotation_id
-        ))
+        logger.debug("Updating INFO header with %s", annotation_id)
         head.add_info(
             annotation_id,
             annotation_number,
@@ -48,9 +46,7 @@ def add_metadata(head, metadata_type, annotation_id, annotation_number='.',
             description
         )
     elif metadata_type == 'version':
-        logger.debug("Updating version header with {0}".format(
-            annotation_id
-        ))
+        logger.debug("Updating version header with %s", annotation_id)
     return
 
 def add_version_header(head, command_line_string = ""):
@@ -42,6 +42,61 @@ Copyright (c) 2013 __MyCompanyName__. All rights reserved.
 import sys
 import os
 
+# Parsed genotype calls. There are only a handful of different GT strings in
+# a vcf ('0/1', '1/1', './.', '0|1', ...) so there is no need to parse them
+# again for every individual and every variant
+_GT_CACHE = {}
+
+def parse_gt(GT):
+    """Parse a genotype call
+    
+        Args:
+            GT (str): The GT field of a vcf genotype, e.g. '0/1'
+        
+        Returns:
+            tuple: (allele_1, allele_2, genotype, genotyped, homo_ref,
+                    homo_alt, heterozygote, has_variant, phased)
+    """
+    gt_info = _GT_CACHE.get(GT)
+    if gt_info is not None:
+        return gt_info
+    
+    genotyped = False
+    homo_ref = False
+    homo_alt = False
+    heterozygote = False
+    has_variant = False
+    #Check phasing
+    phased = '|' in GT
+    #Check the genotyping:
+    #This is the case when only one allele is present(eg. X-chromosome) and presented like '0' or '1':
+    if len(GT) < 3: 
+        allele_1 = GT
+        allele_2 = '.'
+    else:
+        allele_1 = GT[0]
+        allele_2 = GT[-1]
+    # The genotype should allways be represented on the same form
+    genotype = allele_1 +'/'+ allele_2
+    
+    if genotype != './.':
+        genotyped = True
+        #Check allele status
+        if genotype in ['0/0', './0', '0/.']:
+            homo_ref = True
+        elif allele_1 == allele_2:
+            homo_alt = True
+            has_variant = True
+        else:
+            heterozygote = True
+            has_variant = True
+    
+    gt_info = (allele_1, allele_2, genotype, genotyped, homo_ref, homo_alt,
+               heterozygote, has_variant, phased)
+    _GT_CACHE[GT] = gt_info
+    
+    return gt_info
+
 
 class Genotype(object):
     """Holds information about a genotype"""
@@ -53,41 +108,14 @@ class Genotype(object):
         DP = kwargs.get('DP', '0')
         GQ = kwargs.get('GQ', '0')
         PL = kwargs.get('PL', None)
-        self.heterozygote = False
         self.allele_depth = False
-        self.homo_alt = False
-        self.homo_ref = False
-        self.has_variant = False
-        self.genotyped = False
-        self.phased = False
         self.depth_of_coverage = 0
         self.quality_depth = 0
         self.genotype_quality = 0
-        #Check phasing
-        if '|' in GT:
-            self.phased = True
         #Check the genotyping:
-        #This is the case when only one allele is present(eg. X-chromosome) and presented like '0' or '1':
-        if len(GT) < 3: 
-            self.allele_1 = GT
-            self.allele_2 = '.'
-        else:
-            self.allele_1 = GT[0]
-            self.allele_2 = GT[-1]
-        # The genotype should allways be represented on the same form
-        self.genotype = self.allele_1 +'/'+ self.allele_2
-        
-        if self.genotype != './.':
-            self.genotyped = True
-            #Check allele status
-            if self.genotype in ['0/0', './0', '0/.']:
-                self.homo_ref = True
-            elif self.allele_1 == self.allele_2:
-                self.homo_alt = True
-                self.has_variant = True
-            else:
-                self.heterozygote = True
-                self.has_variant = True
+        (self.allele_1, self.allele_2, self.genotype, self.genotyped, 
+         self.homo_ref, self.homo_alt, self.heterozygote, self.has_variant,
+         self.phased) = parse_gt(GT)
         #Check the allele depth:
         self.ref_depth = 0
         self.alt_depth = 0
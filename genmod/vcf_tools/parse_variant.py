@@ -4,6 +4,10 @@ import logging
 
 logging = logging.getLogger(__name__)
 
+#There are several symbols in structural variant calls that make
+#things hard. We will strip those symbols from the variant id
+BAD_ALT_CHARS = str.maketrans('', '', "<>[]:")
+
 def get_variant_dict(variant_line, header_line):
     """Parse a variant line
         
@@ -57,10 +61,7 @@ def get_variant_id(variant_dict):
     chrom = variant_dict['CHROM']
     pos = variant_dict['POS']
     ref = variant_dict['REF']
-    #There are several symbols in structural variant calls that make
-    #things hard. We will strip those symbols
-    bad_chars = "<>[]:"
-    alt = ''.join(c for c in variant_dict['ALT'] if c not in bad_chars)
+    alt = variant_dict['ALT'].translate(BAD_ALT_CHARS)
     return '_'.join([chrom,pos,ref,alt])
 
 def get_vep_dict(vep_string, vep_header, allele=None):
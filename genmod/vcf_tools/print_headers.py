@@ -24,12 +24,12 @@ def print_headers(head, outfile=None, silent=False):
         silent (Bool): If nothing should be printed.
         
     """
-    for header_line in head.print_header():
-        
-        if outfile:
+    if outfile:
+        for header_line in head.print_header():
             outfile.write(header_line+'\n')
-        else:
-            if not silent:
-                print(header_line)
+    elif not silent:
+        for header_line in head.print_header():
+            print(header_line)
+    # Nothing is printed in silent mode so the header lines are never built
     return
 
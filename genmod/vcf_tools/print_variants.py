@@ -70,14 +70,19 @@ def print_variant(variant_line=None, variant_dict=None, header_line=None,
         if not header_line:
             raise IOError("Print line needs a header_line when printing variant dict.")
         print_line = [variant_dict.get(entry, '.') for entry in header_line]
+        
+        if mode == 'modified':
+            print_line = print_line[1:]
+    
+    elif mode == 'modified':
+        # Only the sort column has to be removed so there is no need to split
+        # the whole line
+        print_line = variant_line.rstrip().split('\t', 1)[1:]
     
     else:
         print_line = variant_line.rstrip().split('\t')
-        
-    if mode == 'modified':
-        print_line = print_line[1:]
     
-    elif priority:
+    if mode != 'modified' and priority:
         print_line = [priority] + print_line
 
     print_string = '\t'.join(print_line)
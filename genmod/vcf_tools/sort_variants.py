@@ -54,8 +54,13 @@ def sort_variants(infile, mode='chromosome'):
     logger.info("Sort command: {0}".format(' '.join(command)))
     sort_start = datetime.now()
     
+    # Run sort in the C locale. Then sort compares raw bytes instead of
+    # applying the (much slower) locale collation rules, and numeric keys
+    # are always parsed with '.' as decimal separator
+    sort_env = dict(os.environ, LC_ALL='C')
+    
     try:
-        call(command)
+        call(command, env=sort_env)
     except OSError as e:
         logger.warning("unix program 'sort' does not seem to exist on your system...")
         logger.warning("genmod needs unix sort to provide a sorted output.")
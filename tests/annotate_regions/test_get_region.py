@@ -0,0 +1,45 @@
+from genmod.annotate_regions.parse_annotations import build_region_trees
+from genmod.annotate_regions.get_features import get_region
+
+def test_get_region():
+    # GIVEN some region trees
+    lines = [
+        "13\t1\t100\tHMGA1P6\tENSG00000233440\n",
+        "13\t50\t200\tRNY3P4\tENSG00000207157\n",
+        "13\t300\t1000\tLINC00362\tENSG00000229483\n"
+    ]
+    region_trees = build_region_trees(lines, padding=0)
+
+    # WHEN querying single positions
+    # THEN assert that the overlapping regions are found
+    assert get_region('13', 50, 51, region_trees) == set(['HMGA1P6', 'RNY3P4'])
+    #Intervals are half opened
+    assert get_region('13', 100, 101, region_trees) == set(['RNY3P4'])
+    assert get_region('13', 250, 251, region_trees) == set()
+
+def test_get_region_range():
+    # GIVEN some region trees
+    lines = [
+        "13\t1\t100\tHMGA1P6\tENSG00000233440\n",
+        "13\t300\t1000\tLINC00362\tENSG00000229483\n"
+    ]
+    region_trees = build_region_trees(lines, padding=0)
+
+    # WHEN querying a range that overlaps both regions
+    regions = get_region('13', 90, 310, region_trees)
+
+    # THEN assert that both regions are found
+    assert regions == set(['HMGA1P6', 'LINC00362'])
+
+def test_get_region_missing_chrom():
+    # GIVEN some region trees
+    lines = [
+        "13\t1\t100\tHMGA1P6\tENSG00000233440\n",
+    ]
+    region_trees = build_region_trees(lines, padding=0)
+
+    # WHEN querying a chromosome that has no regions
+    regions = get_region('1', 50, 51, region_trees)
+
+    # THEN assert that no regions are found
+    assert regions == set()
@@ -0,0 +1,23 @@
+import gzip
+
+from tempfile import NamedTemporaryFile
+
+from genmod.commands.utils import get_file_handle
+
+def test_get_file_handle_gzipped():
+    # GIVEN a gzipped file
+    lines = [
+        '##fileformat=VCFv4.1\n',
+        '#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n',
+        '1\t11900\t.\tA\tT\t100\tPASS\tMQ=1\n',
+    ]
+    gz_file = NamedTemporaryFile(delete=False, suffix='.vcf.gz')
+    gz_file.close()
+    with gzip.open(gz_file.name, 'wt') as f:
+        f.writelines(lines)
+
+    # WHEN getting a file handle for it
+    file_handle = get_file_handle(gz_file.name)
+
+    # THEN assert that the lines are returned as text
+    assert list(file_handle) == lines
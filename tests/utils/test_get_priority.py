@@ -25,6 +25,12 @@ def test_get_chr_prority():
     """docstring for test_get_chr_prority"""
     assert get_chromosome_priority(chrom='chr1', chrom_dict={}) == '1'
 
+def test_get_repeated_priority():
+    """Test that repeated lookups give the same priority"""
+    assert get_chromosome_priority(chrom='chrX', chrom_dict={}) == '23'
+    assert get_chromosome_priority(chrom='chrX', chrom_dict={}) == '23'
+    assert get_chromosome_priority(chrom='X', chrom_dict={}) == '23'
+
 def test_get_custom_prority():
     """docstring for test_get_chr_prority"""
     assert get_chromosome_priority(chrom='AHA_1', chrom_dict={'AHA_1':2, 'AHA_2':3}) == 2
@@ -1,14 +1,12 @@
 from codecs import open
 from tempfile import NamedTemporaryFile
-from multiprocessing import Manager, util
+from multiprocessing import Queue
 from collections import OrderedDict
 
 from genmod.utils import VariantPrinter
 from genmod.vcf_tools import (get_variant_dict, get_info_dict, 
 get_variant_id, HeaderParser)
 
-util.abstract_sockets_supported = False
-
 def setup_vcf_file():
     """
     Print some variants to a vcf file and return the filename
@@ -40,7 +38,7 @@ def setup_vcf_file():
 def test_variant_printer():
     """Test the variant printer"""
     vcf_file = setup_vcf_file()
-    variant_queue = Manager().Queue()
+    variant_queue = Queue()
     head = HeaderParser()
     
     outfile = NamedTemporaryFile(mode='w+t', delete=False, suffix='.vcf')
@@ -85,4 +83,101 @@ def test_variant_printer():
             variants.append(line.rstrip().split('\t'))
     
     assert variants[0][0] == '1'
-    assert variants[0][2] == '11900'
\ No newline at end of file
+    assert variants[0][2] == '11900'
+
+
+def test_variant_printer_batches():
+    """Test the variant printer with batches of variants"""
+    vcf_file = setup_vcf_file()
+    variant_queue = Queue()
+    head = HeaderParser()
+    
+    outfile = NamedTemporaryFile(mode='w+t', delete=False, suffix='.vcf')
+    outfile.close()
+    
+    variant_printer = VariantPrinter(
+        task_queue=variant_queue, 
+        head=head, 
+        mode='normal', 
+        outfile = outfile.name
+    )
+    
+    batch = []
+    
+    for line in open(vcf_file):
+        line = line.rstrip()
+
+        if line.startswith('#'):
+            if line.startswith('##'):
+                head.parse_meta_data(line)
+            else:
+                head.parse_header_line(line)
+        else:
+            variant_dict = get_variant_dict(line, head.header)
+            variant_dict['variant_id'] = get_variant_id(variant_dict)
+            variant_dict['info_dict'] = get_info_dict(variant_dict['INFO'])
+    
+            batch.append(variant_dict)
+    
+    variant_printer.start()
+    
+    variant_queue.put(batch[:5])
+    variant_queue.put(batch[5:])
+    variant_queue.put(None)
+    
+    variant_printer.join()
+    
+    variants = []
+    with open(outfile.name, 'r', 'utf-8-sig') as f:
+        for line in f:
+            variants.append(line.rstrip().split('\t'))
+    
+    assert len(variants) == 9
+    assert variants[0][1] == '11900'
+    assert variants[5][0] == '3'
+
+
+def test_variant_printer_failing_outfile():
+    """Test that the printer empties the queue and keeps the error if printing fails"""
+    vcf_file = setup_vcf_file()
+    variant_queue = Queue(maxsize=1)
+    head = HeaderParser()
+    
+    outfile = NamedTemporaryFile(mode='w+t', delete=False, suffix='.vcf')
+    # Writing to a closed file handle raises an error
+    outfile.close()
+    
+    batch = []
+    
+    for line in open(vcf_file):
+        line = line.rstrip()
+
+        if line.startswith('#'):
+            if line.startswith('##'):
+                head.parse_meta_data(line)
+            else:
+                head.parse_header_line(line)
+        else:
+            variant_dict = get_variant_dict(line, head.header)
+            variant_dict['variant_id'] = get_variant_id(variant_dict)
+            variant_dict['info_dict'] = get_info_dict(variant_dict['INFO'])
+    
+            batch.append(variant_dict)
+    
+    variant_printer = VariantPrinter(
+        task_queue=variant_queue, 
+        head=head, 
+        mode='normal', 
+        outfile = outfile
+    )
+    
+    variant_printer.start()
+    
+    # These puts would block if the printer stopped consuming the queue
+    for variant in batch:
+        variant_queue.put([variant])
+    variant_queue.put(None)
+    
+    variant_printer.join()
+    
+    assert isinstance(variant_printer.exception, ValueError)
@@ -1,4 +1,4 @@
-from genmod.annotate_variants.read_tabix_files import (get_tabix_records)
+from genmod.annotate_variants.read_tabix_files import get_tabix_records
 
 def test_get_tabix_record(thousand_g_handle):
     chrom = '1'
@@ -12,11 +12,17 @@ def test_get_tabix_record(thousand_g_handle):
 def test_get_tabix_record_chr(thousand_g_chr_handle):
     chrom = '1'
     start = '879537'
+    contig_names = {}
     i = None
-    for i, row in enumerate(get_tabix_records(thousand_g_chr_handle, chrom, start)):
+    for i, row in enumerate(get_tabix_records(thousand_g_chr_handle, chrom, 
+                                              start, contig_names)):
         print(row)
     #Should find one row
     assert i == 0
+    #The chromosome name used in the file should be remembered
+    assert contig_names[chrom] == 'chr1'
+    records = get_tabix_records(thousand_g_chr_handle, chrom, start, contig_names)
+    assert len(list(records)) == 1
 
 
 def test_get_non_existing_tabix_record(thousand_g_handle):
@@ -26,4 +32,16 @@ def test_get_non_existing_tabix_record(thousand_g_handle):
     for i, row in enumerate(get_tabix_records(thousand_g_handle, chrom, start)):
         print(row)
     #Should find one row
-    assert i == None
\ No newline at end of file
+    assert i == None
+
+
+def test_get_tabix_record_missing_chrom(thousand_g_handle):
+    chrom = 'GL000192.1'
+    start = '879537'
+    contig_names = {}
+    records = get_tabix_records(thousand_g_handle, chrom, start, contig_names)
+    assert list(records) == []
+    #Chromosomes that are not in the file should not be queried again
+    assert contig_names[chrom] is None
+    records = get_tabix_records(thousand_g_handle, chrom, start, contig_names)
+    assert list(records) == []
@@ -170,4 +170,18 @@ def test_phased_data():
     assert my_genotype.genotyped
     assert my_genotype.phased
 
-    
\ No newline at end of file
+    
+def test_repeated_genotype_calls():
+    """
+    Genotype calls are cached on the GT string. 
+    Phased and unphased calls of the same alleles should still differ.
+    """
+    first_genotype = Genotype(**{'GT':'0|1', 'GQ':'60'})
+    second_genotype = Genotype(**{'GT':'0|1', 'GQ':'20'})
+    unphased_genotype = Genotype(**{'GT':'0/1'})
+    assert first_genotype.heterozygote and second_genotype.heterozygote
+    assert first_genotype.phased and second_genotype.phased
+    assert first_genotype.genotype_quality == 60
+    assert second_genotype.genotype_quality == 20
+    assert unphased_genotype.heterozygote
+    assert not unphased_genotype.phased